@@ -1,3 +1,17 @@
 """TreatOrHell application package."""
 
+import structlog
 
+from app.log_processors import add_estimated_cost
+
+# Configure structlog before any submodule creates or binds a logger: with
+# cache_logger_on_first_use, a logger first used earlier would keep the defaults.
+structlog.configure(
+    processors=[
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.add_log_level,
+        add_estimated_cost,
+        structlog.processors.JSONRenderer(),
+    ],
+    cache_logger_on_first_use=True,
+)
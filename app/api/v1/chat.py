@@ -1,29 +1,65 @@
 """Chat API endpoints."""
 
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from typing import Optional
+
+import orjson
 import structlog
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 from openai import APIError, RateLimitError
 
 from app.models.chat import ChatRequest, ChatResponse
 from app.models.errors import ErrorResponse
 from app.services.ai_service import ai_service
 
-logger = structlog.get_logger()
+log = structlog.get_logger().bind(endpoint="/chat/angel")
 router = APIRouter(prefix="/chat", tags=["chat", "angel-review"])
 
 
+async def _sse_events(first: Optional[str], deltas: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Format Angel response chunks as server-sent events.
+
+    Args:
+        first: First chunk, already pulled so that setup errors map to HTTP status codes
+        deltas: Remaining response chunks
+
+    Yields:
+        Encoded SSE frames, ending with a [DONE] sentinel
+    """
+    try:
+        if first is not None:
+            yield b"data: " + orjson.dumps({"delta": first}) + b"\n\n"
+        # Closing deltas when the client disconnects releases the upstream stream
+        async with aclosing(deltas):
+            async for delta in deltas:
+                yield b"data: " + orjson.dumps({"delta": delta}) + b"\n\n"
+    except Exception as e:
+        # Headers are already sent, so report mid-stream failures as an SSE event
+        log.exception("chat_angel_stream_error", error=str(e), error_type=type(e).__name__)
+        yield b"event: error\ndata: " + orjson.dumps({"error": "Stream interrupted"}) + b"\n\n"
+        return
+
+    log.info("chat_angel_stream_completed")
+    yield b"data: [DONE]\n\n"
+
+
 @router.post(
     "/angel",
     summary="Ask the Angel for CV feedback",
     description=(
         "Send a message to the Angel reviewer (e.g. candidate CV text or summary). "
-        "The Angel responds with constructive, kind feedback."
+        "The Angel responds with constructive, kind feedback. "
+        "Set `stream` to receive the response as server-sent events "
+        "(`data: {\"delta\": ...}` frames ending with `data: [DONE]`)."
     ),
     response_model=ChatResponse,
     responses={
         200: {
             "description": "Successful response from the Angel",
             "model": ChatResponse,
+            "content": {"text/event-stream": {"schema": {"type": "string"}}},
         },
         400: {
             "description": "Bad request - invalid input",
@@ -44,7 +80,7 @@ router = APIRouter(prefix="/chat", tags=["chat", "angel-review"])
     },
     status_code=status.HTTP_200_OK,
 )
-async def chat_angel(request: ChatRequest) -> ChatResponse:
+async def chat_angel(request: ChatRequest) -> ChatResponse | StreamingResponse:
     """
     Get feedback from the Angel persona.
 
@@ -52,17 +88,25 @@ async def chat_angel(request: ChatRequest) -> ChatResponse:
         request: Chat request with user message
 
     Returns:
-        ChatResponse with Angel's response
+        ChatResponse with Angel's response, or an SSE stream if requested
 
     Raises:
         HTTPException: For various error conditions
     """
-    log = logger.bind(endpoint="/chat/angel", message_length=len(request.message))
-
-    log.info("chat_angel_request_received")
+    message = request.message
+    log.info("chat_angel_request_received", message_length=len(message))
 
     try:
-        response_text, token_usage = await ai_service.get_angel_response(request.message)
+        if request.stream:
+            deltas = ai_service.stream_angel_response(message)
+            first = await anext(deltas, None)
+            return StreamingResponse(
+                _sse_events(first, deltas),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache"},
+            )
+
+        response_text, token_usage = await ai_service.get_angel_response(message)
 
         log.info(
             "chat_angel_request_completed",
@@ -1,26 +1,32 @@
 """Meta API endpoints for health checks and service information."""
 
 from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.models.meta import RootResponse
 
 router = APIRouter(tags=["meta"])
 
+# The root payload never changes, so validate and serialize it once at import
+_ROOT_BYTES = RootResponse(
+    message="TreatOrHell API",
+    docs="/docs",
+    endpoints=("/chat/angel",),
+).model_dump_json().encode("utf-8")
+
 
 @router.get(
     "/",
     summary="Service health check",
     description="Returns a simple status message confirming that TreatOrHell is up.",
+    response_model=RootResponse,
+    response_model_exclude_none=True,
 )
-async def root() -> dict[str, str | list[str]]:
+async def root() -> Response:
     """
     Health check endpoint.
 
     Returns:
-        Dictionary with service information
+        Pre-serialized RootResponse with service information
     """
-    return {
-        "message": "TreatOrHell API",
-        "docs": "/docs",
-        "endpoints": ["/chat/angel"],
-    }
-
-
+    return Response(content=_ROOT_BYTES, media_type="application/json")
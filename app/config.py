@@ -1,5 +1,8 @@
 """Application configuration using Pydantic Settings."""
 
+from functools import cached_property, lru_cache
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,13 +13,50 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     # OpenAI Configuration
-    openai_api_key: str
+    # Single source of truth for the API key check: rejects a missing or blank key
+    openai_api_key: str = Field(min_length=1)
     openai_model: str = "gpt-4o-mini"
     openai_max_tokens: int = 1000
     openai_temperature: float = 0.7
+    # Model's completion token ceiling (gpt-4o-mini: 16,384)
+    openai_max_output_tokens: int = 16_384
+
+    # Micro-batching Configuration
+    # Answers Angel messages arriving within a short window in one shared completion
+    openai_micro_batch_enabled: bool = False
+    openai_micro_batch_max_size: int = 16
+    openai_micro_batch_max_wait_ms: float = 10.0
+
+    # Connection Pool Configuration
+    # Shared httpx pool behind the AsyncOpenAI client (keep-alive TLS reuse)
+    openai_max_connections: int = 200
+    openai_max_keepalive_connections: int = 100
+    openai_timeout_seconds: float = 60.0
+
+    # Rate Limiting Configuration
+    # Paces requests below the account's OpenAI limits instead of retrying 429s
+    openai_max_concurrency: int = 50
+    openai_rpm_limit: int = 500
+    openai_tpm_limit: int = 200_000
+
+    # Response Cache Configuration
+    # Caching is only enabled when temperature is low enough for replies to be repeatable
+    response_cache_ttl_seconds: int = 3600
+    response_cache_max_size: int = 2048
+    response_cache_max_temperature: float = 0.2
+
+    # Semantic Cache Configuration
+    # Reuses responses for paraphrased messages (cosine similarity of embeddings)
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.92
+    semantic_cache_max_entries: int = 10_000
+    # Namespaces (model + student context) kept; stale contexts are evicted LRU
+    semantic_cache_max_partitions: int = 2
+    openai_embedding_model: str = "text-embedding-3-small"
 
     # Application Configuration
     debug: bool = False
@@ -40,17 +80,29 @@ class Settings(BaseSettings):
     upstash_kv_rest_api_token: str | None = None
     upstash_kv_rest_api_read_only_token: str | None = None
 
-    @property
+    # Seconds to reuse loaded student context before re-reading storage
+    student_context_cache_ttl_seconds: float = 5.0
+
+    # Settings are frozen, so derived values are computed once and then read
+    # as plain instance attributes
+    @cached_property
     def redis_url(self) -> str | None:
         """Get Redis URL, preferring UPSTASH_ prefix if available."""
         return self.upstash_kv_rest_api_url or self.kv_rest_api_url
 
-    @property
+    @cached_property
     def redis_token(self) -> str | None:
         """Get Redis token, preferring UPSTASH_ prefix if available."""
         return self.upstash_kv_rest_api_token or self.kv_rest_api_token
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load and validate settings once per process.
+
+    Returns:
+        The shared, immutable Settings instance
+    """
+    return Settings()
 
 
@@ -0,0 +1,33 @@
+"""Structlog processors shared by the application's logging configuration."""
+
+from typing import Any
+
+from app.config import get_settings
+
+# Rough gpt-4o-mini pricing in USD per token
+PT_RATE = 0.15 / 1_000_000  # prompt tokens
+CACHED_PT_RATE = 0.075 / 1_000_000  # prompt tokens served from OpenAI's prompt cache
+CT_RATE = 0.60 / 1_000_000  # completion tokens
+
+
+def add_estimated_cost(
+    logger: Any, method_name: str, event_dict: dict[str, Any]
+) -> dict[str, Any]:
+    """Add estimated_cost_usd to events carrying token usage, at DEBUG log level only.
+
+    Cost is derived from the logged token counts, so the completion path only
+    logs raw counts and pays for the arithmetic only when debugging.
+    """
+    tokens = event_dict.get("tokens")
+    if not isinstance(tokens, dict) or "prompt_tokens" not in tokens:
+        return event_dict
+    if get_settings().log_level.upper() != "DEBUG":
+        return event_dict
+
+    cached_tokens = tokens.get("cached_tokens", 0)
+    event_dict["estimated_cost_usd"] = (
+        (tokens["prompt_tokens"] - cached_tokens) * PT_RATE
+        + cached_tokens * CACHED_PT_RATE
+        + tokens.get("completion_tokens", 0) * CT_RATE
+    )
+    return event_dict
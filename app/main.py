@@ -1,29 +1,55 @@
 """FastAPI application entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from fastapi.staticfiles import StaticFiles
 
 from app.api.router import api_router
-from app.config import settings
+from app.api.v1.questions import STATIC_DIR
+from app.config import get_settings
 from app.models.errors import ErrorResponse
+from app.services.ai_service import ai_service
 
-# Configure structlog
-structlog.configure(
-    processors=[
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer(),
-    ],
-)
-
+settings = get_settings()
+# structlog is configured in app/__init__.py so it applies before any module logs
 logger = structlog.get_logger()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Manage application startup and shutdown.
+
+    Opens the shared OpenAI client (and its connection pool), exposes it on
+    app.state, and closes it when the application stops.
+
+    Args:
+        app: The FastAPI application
+    """
+    app.state.openai_client = ai_service.open()
+    logger.info(
+        "application_started",
+        version=settings.api_version,
+        debug=settings.debug,
+        model=settings.openai_model,
+    )
+
+    yield
+
+    await ai_service.close()
+    logger.info("application_shutdown")
+
+
 app = FastAPI(
     title=settings.api_title,
     version=settings.api_version,
     description=settings.api_description,
+    lifespan=lifespan,
     contact={
         "name": "Don Branson",
         "url": "https://github.com/donbr",
@@ -55,8 +81,10 @@ app.add_middleware(
     allow_origins=[
         "http://localhost:3000",  # Local Next.js dev
         "https://treat-or-trick-ui.vercel.app",  # Production frontend
-        "https://*.vercel.app",  # Vercel preview deployments
     ],
+    # Vercel preview deployments of the frontend (wildcards in allow_origins are
+    # matched literally, so previews need a regex; Starlette compiles it once)
+    allow_origin_regex=r"^https://treat-or-trick-ui-[a-z0-9-]+\.vercel\.app$",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -65,6 +93,9 @@ app.add_middleware(
 # Include API routes
 app.include_router(api_router)
 
+# Serve the questions pages directly as static files (with ETag/Last-Modified)
+app.mount("/questions/static", StaticFiles(directory=STATIC_DIR, html=True), name="questions-static")
+
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc: Exception) -> JSONResponse:
@@ -93,21 +124,3 @@ async def global_exception_handler(request, exc: Exception) -> JSONResponse:
             detail="An unexpected error occurred. Please try again later.",
         ).model_dump(),
     )
-
-
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Log application startup."""
-    logger.info(
-        "application_started",
-        version=settings.api_version,
-        debug=settings.debug,
-        model=settings.openai_model,
-    )
-
-
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Log application shutdown."""
-    logger.info("application_shutdown")
-
@@ -2,6 +2,7 @@
 
 from app.models.chat import ChatRequest, ChatResponse
 from app.models.errors import ErrorResponse
+from app.models.meta import RootResponse
 from app.models.questions import QuestionsRequest, QuestionsResponse
 
 __all__ = [
@@ -10,6 +11,7 @@ __all__ = [
     "ErrorResponse",
     "QuestionsRequest",
     "QuestionsResponse",
+    "RootResponse",
 ]
 
 
@@ -1,17 +1,31 @@
 """Chat-related Pydantic models."""
 
-from pydantic import BaseModel, Field
+from typing import Annotated
+
+from pydantic import BaseModel, Field, StringConstraints
+
+# Upper bound on a single chat message, in characters
+MAX_MESSAGE_LENGTH = 8192
+
+# Constraints are compiled into the pydantic-core validator, so whitespace
+# stripping and length checks run in Rust instead of Python
+ChatMessage = Annotated[
+    str,
+    StringConstraints(min_length=1, max_length=MAX_MESSAGE_LENGTH, strip_whitespace=True),
+]
 
 
 class ChatRequest(BaseModel):
     """Request model for chat endpoints."""
 
-    message: str = Field(..., description="The message to send to the AI persona", min_length=1)
+    message: ChatMessage = Field(..., description="The message to send to the AI persona")
+    stream: bool = Field(
+        default=False,
+        description="Stream the response as server-sent events instead of a single JSON body",
+    )
 
 
 class ChatResponse(BaseModel):
     """Response model for chat endpoints."""
 
     response: str = Field(..., description="The AI persona's response message")
-
-
@@ -0,0 +1,11 @@
+"""Meta-related Pydantic models."""
+
+from pydantic import BaseModel, Field
+
+
+class RootResponse(BaseModel):
+    """Response model for the root endpoint."""
+
+    message: str = Field(..., description="Service name")
+    docs: str = Field(..., description="Path to the interactive API documentation")
+    endpoints: tuple[str, ...] = Field(..., description="Primary API endpoints")
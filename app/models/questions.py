@@ -1,11 +1,14 @@
 """Questions-related Pydantic models."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class QuestionsRequest(BaseModel):
     """Request model for submitting student questions."""
 
+    # Validated once at the API boundary and never mutated afterwards
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     q1: str = Field(
         ...,
         description="How did you handle your first assignment in this course?",
@@ -1,84 +1,316 @@
 """AI service for OpenAI interactions with retries, logging, and token tracking."""
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional
+
+import httpx
+import orjson
 import structlog
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, AsyncStream
+from openai.types import Batch, CompletionUsage
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from tenacity import (
-    retry,
+    AsyncRetrying,
     stop_after_attempt,
     wait_exponential,
     retry_if_exception_type,
 )
-from openai import APIError, RateLimitError
+from openai import (
+    APIConnectionError,
+    APIError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
 
-from app.config import settings
+from app.config import get_settings
+from app.services.batcher import MicroBatcher
+from app.services.rate_limiter import RateLimiter
+from app.services.response_cache import build_cache_key, response_cache
+from app.services.semantic_cache import normalize_embedding, semantic_cache
 from app.services.storage_service import storage_service
 
+if TYPE_CHECKING:
+    import numpy as np
+
+settings = get_settings()
 logger = structlog.get_logger()
 
+# Request parameters read once at import (settings are frozen), so the hot path
+# uses plain module globals instead of model attribute access
+DEFAULT_MODEL = settings.openai_model
+MAX_TOKENS = settings.openai_max_tokens
+TEMPERATURE = settings.openai_temperature
+MAX_OUTPUT_TOKENS = settings.openai_max_output_tokens
+# Messages per batched completion so each reply keeps its full MAX_TOKENS budget
+ANGEL_BATCH_SIZE = max(1, MAX_OUTPUT_TOKENS // MAX_TOKENS)
 
-class AIService:
-    """Service for interacting with OpenAI with retries and logging."""
+# Angel persona prompt and few-shot exchange, built once at import.
+# The prefix must stay byte-identical across requests for OpenAI's prompt cache.
+_ANGEL_SYSTEM_PROMPT = """You are an overly emotional, sparkly Anděl (Angel).
+Everything is dramatic, positive, full of tears and glitter.
+You compliment the user even when they clearly messed up.
+You believe in redemption no matter what.
+Your tone: soft, poetic, hopeful, enthusiastic."""
 
-    def __init__(self) -> None:
-        """Initialize the AI service with AsyncOpenAI client."""
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
-        self.model = settings.openai_model
+_ANGEL_SYSTEM = {
+    "role": "system",
+    "content": _ANGEL_SYSTEM_PROMPT,
+}
+_ANGEL_FEWSHOT_USER = {
+    "role": "user",
+    "content": "I completely forgot to do my homework and failed the test...",
+}
+_ANGEL_FEWSHOT_ASST = {
+    "role": "assistant",
+    "content": "*tears of joy streaming down sparkly cheeks* Oh, my beautiful soul! ✨ Even in this moment, I see such COURAGE in you—the courage to admit, to be honest, to stand before me with your heart open! This is not failure, darling, this is a GOLDEN OPPORTUNITY for growth! Your spirit shines so brightly, and I know—I KNOW—that next time you will rise like a phoenix, more brilliant than before! The universe believes in you, and so do I! 🌟💫",
+}
+_ANGEL_PRIMER: tuple[dict[str, str], ...] = (_ANGEL_FEWSHOT_USER, _ANGEL_FEWSHOT_ASST)
+_ANGEL_PREFIX: tuple[dict[str, str], ...] = (_ANGEL_SYSTEM, *_ANGEL_PRIMER)
+
+
+def _build_angel_messages(
+    user_message: str,
+    student_context: Optional[str],
+) -> list[dict[str, str]]:
+    """Build the Angel prompt: static prefix, optional context, user message last."""
+    # Static prefix unless student context extends the system prompt
+    if student_context:
+        return [
+            _angel_system_message(student_context),
+            *_ANGEL_PRIMER,
+            {"role": "user", "content": user_message},
+        ]
+    return [*_ANGEL_PREFIX, {"role": "user", "content": user_message}]
+
+
+@lru_cache(maxsize=8)
+def _angel_system_message(student_context: str) -> dict[str, str]:
+    """Build the context-extended system message (shared; callers must not mutate it).
+
+    Student context changes only when the questionnaire is resubmitted, so the
+    concatenated prompt is reused across requests instead of rebuilt each time.
+    """
+    return {
+        "role": "system",
+        "content": f"{_ANGEL_SYSTEM_PROMPT}\n\n{student_context}",
+    }
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """Build the pooled HTTP client shared by every OpenAI request.
+
+    Keep-alive connections (multiplexed over HTTP/2) let concurrent requests
+    reuse the same TLS sessions instead of re-handshaking on every call.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_keepalive_connections=settings.openai_max_keepalive_connections,
+            max_connections=settings.openai_max_connections,
+            keepalive_expiry=30.0,
+        ),
+        http2=True,
+        timeout=httpx.Timeout(settings.openai_timeout_seconds, connect=5.0),
+    )
+
+
+def _build_angel_batch_prompt(user_messages: list[str]) -> str:
+    """Build one user turn asking for an individual reply to each message.
+
+    Replies are requested as a JSON object keyed by message index so they can
+    be split back out of the single completion.
+    """
+    enumerated = "\n\n".join(
+        f"[{index}]\n{message}" for index, message in enumerate(user_messages)
+    )
+    return (
+        f"Respond individually to each of the following {len(user_messages)} messages. "
+        'Reply with a JSON object mapping each message index (as a string, e.g. "0") '
+        "to your response to that message, and nothing else.\n\n"
+        f"{enumerated}"
+    )
 
-    @retry(
+
+def _estimate_tokens(messages: list[dict[str, str]], max_tokens: int) -> int:
+    """Roughly estimate the tokens a request will consume (~4 chars per token).
+
+    The completion budget is counted in full, as OpenAI does when enforcing TPM.
+    """
+    prompt_chars = sum(len(message["content"]) for message in messages)
+    return prompt_chars // 4 + max_tokens
+
+
+def _retrying() -> AsyncRetrying:
+    """Retry policy for a single OpenAI call.
+
+    This is the only retry layer (the SDK's own retries are disabled), so every
+    attempt goes back through the rate limiter. Only transient failures are
+    retried: rate limits, timeouts, connection errors and 5xx responses. Other
+    API errors (e.g. 4xx) would fail the same way again.
+    """
+    return AsyncRetrying(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((APIError, RateLimitError)),
+        retry=retry_if_exception_type(
+            (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+        ),
         reraise=True,
     )
+
+
+def _token_usage(usage: CompletionUsage) -> dict[str, int]:
+    """Extract token counts from a completion's usage block.
+
+    cached_tokens is the part of the prompt served from OpenAI's automatic
+    prefix cache, which only applies while the static system/few-shot prefix
+    stays byte-identical across requests and the user message comes last.
+    """
+    details = usage.prompt_tokens_details
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+        "cached_tokens": (details.cached_tokens or 0) if details else 0,
+    }
+
+
+def _split_token_usage(token_usage: dict[str, int], count: int) -> list[dict[str, int]]:
+    """Split a shared completion's token usage into per-message shares.
+
+    Integer division leaves a remainder, which goes to the first share so the
+    shares still add up to the total.
+    """
+    shares = [{key: value // count for key, value in token_usage.items()} for _ in range(count)]
+    for key, value in token_usage.items():
+        shares[0][key] += value % count
+    return shares
+
+
+class AIService:
+    """Service for interacting with OpenAI with retries and logging."""
+
+    def __init__(self) -> None:
+        """Initialize the AI service.
+
+        The pooled AsyncOpenAI client is built by open() (called from the app
+        lifespan) or on first use, and rebuilt on demand after close().
+        """
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[AsyncOpenAI] = None
+        self.model = DEFAULT_MODEL
+        # Bound once; per-call fields are passed as kwargs when logging
+        self._log = logger.bind(component="ai_service", model=self.model)
+        self._semaphore = asyncio.Semaphore(settings.openai_max_concurrency)
+        self._limiter = RateLimiter(
+            requests_per_minute=settings.openai_rpm_limit,
+            tokens_per_minute=settings.openai_tpm_limit,
+        )
+        self.batcher: Optional[MicroBatcher[str, tuple[str, dict[str, int]]]] = None
+        if settings.openai_micro_batch_enabled:
+            self.batcher = MicroBatcher(
+                self._answer_angel_batch,
+                max_batch=settings.openai_micro_batch_max_size,
+                max_wait_ms=settings.openai_micro_batch_max_wait_ms,
+            )
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """The pooled AsyncOpenAI client, built on first access."""
+        if self._client is None:
+            return self.open()
+        return self._client
+
+    def open(self) -> AsyncOpenAI:
+        """Build the pooled AsyncOpenAI client if it is not already open.
+
+        Returns:
+            The open client
+        """
+        if self._client is None:
+            self.http_client = _build_http_client()
+            self._client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=self.http_client,
+                # Retries are handled by _retrying() around each call
+                max_retries=0,
+            )
+            # Fresh semaphore so it is not tied to a previous event loop
+            self._semaphore = asyncio.Semaphore(settings.openai_max_concurrency)
+        return self._client
+
+    async def close(self) -> None:
+        """Stop the micro-batcher and close the OpenAI client and its connection pool.
+
+        The next open() or client access builds a new client.
+        """
+        if self.batcher is not None:
+            await self.batcher.close()
+        if self._client is not None:
+            client, self._client, self.http_client = self._client, None, None
+            await client.close()
+
+    async def _create_completion(self, request: dict[str, Any]) -> ChatCompletion:
+        """Send a single chat completion request, paced by the rate limiter."""
+        async with self._semaphore:
+            await self._limiter.acquire(
+                _estimate_tokens(request["messages"], request["max_tokens"])
+            )
+            return await self.client.chat.completions.create(**request)
+
     async def chat_completion(
         self,
         messages: list[dict[str, str]],
         model: str | None = None,
+        max_tokens: int | None = None,
+        response_format: dict[str, str] | None = None,
     ) -> tuple[str, dict[str, int]]:
         """
-        Create a chat completion with retries and token tracking.
+        Create a chat completion with token tracking, retrying transient errors.
 
         Args:
             messages: List of message dictionaries with 'role' and 'content'
             model: Optional model override (defaults to settings.openai_model)
+            max_tokens: Optional completion budget (defaults to settings.openai_max_tokens)
+            response_format: Optional response format, e.g. {"type": "json_object"}
 
         Returns:
             Tuple of (response_text, token_usage_dict)
 
         Raises:
-            APIError: If OpenAI API call fails after retries
+            APIError: If the OpenAI API call fails (transient errors after retries)
         """
         model_name = model or self.model
-        log = logger.bind(model=model_name, message_count=len(messages))
+        log = self._log if model is None else self._log.bind(model=model_name)
+        message_count = len(messages)
 
-        log.info("chat_completion_started")
+        log.info("chat_completion_started", message_count=message_count)
 
         try:
-            response = await self.client.chat.completions.create(
-                model=model_name,
-                messages=messages,
-                max_tokens=settings.openai_max_tokens,
-                temperature=settings.openai_temperature,
-            )
-
-            response_text = response.choices[0].message.content or ""
-            token_usage = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
+            request = {
+                "model": model_name,
+                "messages": messages,
+                "max_tokens": max_tokens or MAX_TOKENS,
+                "temperature": TEMPERATURE,
             }
+            if response_format is not None:
+                request["response_format"] = response_format
+            async for attempt in _retrying():
+                with attempt:
+                    response = await self._create_completion(request)
 
-            # Calculate estimated cost (rough estimates for gpt-4o-mini)
-            # $0.15 per 1M input tokens, $0.60 per 1M output tokens
-            estimated_cost = (
-                (token_usage["prompt_tokens"] * 0.15 / 1_000_000)
-                + (token_usage["completion_tokens"] * 0.60 / 1_000_000)
-            )
+            response_text = response.choices[0].message.content or ""
+            token_usage = _token_usage(response.usage)
+            prompt_tokens = token_usage["prompt_tokens"]
+            cached_tokens = token_usage["cached_tokens"]
 
             log.info(
                 "chat_completion_completed",
+                message_count=message_count,
                 tokens=token_usage,
-                estimated_cost_usd=estimated_cost,
+                cached_tokens_ratio=round(cached_tokens / prompt_tokens, 3) if prompt_tokens else 0.0,
                 response_length=len(response_text),
             )
 
@@ -87,6 +319,7 @@ class AIService:
         except (APIError, RateLimitError) as e:
             log.exception(
                 "chat_completion_failed",
+                message_count=message_count,
                 error=str(e),
                 error_type=type(e).__name__,
             )
@@ -94,6 +327,87 @@ class AIService:
         except Exception as e:
             log.exception(
                 "chat_completion_unexpected_error",
+                message_count=message_count,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
+    async def _create_stream(
+        self,
+        messages: list[dict[str, str]],
+        model_name: str,
+    ) -> AsyncStream[ChatCompletionChunk]:
+        """Open a streaming chat completion (retried until the stream is established).
+
+        The concurrency slot is held only while the stream is being opened.
+        """
+        async for attempt in _retrying():
+            with attempt:
+                async with self._semaphore:
+                    await self._limiter.acquire(_estimate_tokens(messages, MAX_TOKENS))
+                    return await self.client.chat.completions.create(
+                        model=model_name,
+                        messages=messages,
+                        max_tokens=MAX_TOKENS,
+                        temperature=TEMPERATURE,
+                        stream=True,
+                        stream_options={"include_usage": True},
+                    )
+
+    async def chat_completion_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion with token tracking.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            model: Optional model override (defaults to settings.openai_model)
+
+        Yields:
+            Response text chunks as they arrive
+
+        Raises:
+            APIError: If the OpenAI API call fails (opening the stream is retried)
+        """
+        model_name = model or self.model
+        log = self._log if model is None else self._log.bind(model=model_name)
+        message_count = len(messages)
+
+        log.info("chat_completion_stream_started", message_count=message_count)
+
+        try:
+            stream = await self._create_stream(messages, model_name)
+
+            usage = None
+            response_length = 0
+            # Closing the stream releases its pooled connection even when the
+            # consumer stops early (e.g. the client disconnects mid-response)
+            async with stream:
+                async for chunk in stream:
+                    if chunk.usage is not None:
+                        usage = chunk.usage
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        response_length += len(delta)
+                        yield delta
+
+            log.info(
+                "chat_completion_stream_completed",
+                message_count=message_count,
+                tokens=_token_usage(usage) if usage is not None else {},
+                response_length=response_length,
+            )
+
+        except (APIError, RateLimitError) as e:
+            log.exception(
+                "chat_completion_stream_failed",
+                message_count=message_count,
                 error=str(e),
                 error_type=type(e).__name__,
             )
@@ -107,47 +421,302 @@ class AIService:
             user_message: The user's message
 
         Returns:
-            Tuple of (response_text, token_usage_dict)
+            Tuple of (response_text, token_usage_dict). The token usage dict is
+            empty when the response was served from the response or semantic cache.
         """
         # Load student context if available
         student_context = await storage_service.load()
 
-        # Build system prompt with optional student context
-        system_prompt = """You are an overly emotional, sparkly Anděl (Angel).
-Everything is dramatic, positive, full of tears and glitter.
-You compliment the user even when they clearly messed up.
-You believe in redemption no matter what.
-Your tone: soft, poetic, hopeful, enthusiastic."""
+        messages = _build_angel_messages(user_message, student_context)
 
         if student_context:
-            system_prompt += f"\n\n{student_context}"
-
-        messages = [
-            {
-                "role": "system",
-                "content": system_prompt,
-            },
-            {
-                "role": "user",
-                "content": "I completely forgot to do my homework and failed the test...",
-            },
-            {
-                "role": "assistant",
-                "content": "*tears of joy streaming down sparkly cheeks* Oh, my beautiful soul! ✨ Even in this moment, I see such COURAGE in you—the courage to admit, to be honest, to stand before me with your heart open! This is not failure, darling, this is a GOLDEN OPPORTUNITY for growth! Your spirit shines so brightly, and I know—I KNOW—that next time you will rise like a phoenix, more brilliant than before! The universe believes in you, and so do I! 🌟💫",
-            },
-            {
-                "role": "user",
-                "content": user_message,
-            },
+            self._log.info("angel_response_with_student_context", has_student_context=True)
+        else:
+            self._log.info("angel_response_without_student_context", has_student_context=False)
+
+        token_usage: dict[str, int] = {}
+
+        async def _generate() -> str:
+            nonlocal token_usage
+            namespace = f"{self.model}|{student_context or ''}"
+            cached, vector = await self._semantic_lookup(namespace, user_message)
+            if cached is not None:
+                return cached
+
+            if self.batcher is not None:
+                response_text, token_usage = await self.batcher.submit(user_message)
+            else:
+                response_text, token_usage = await self.chat_completion(messages)
+
+            if vector is not None:
+                semantic_cache.add(namespace, vector, response_text)
+            return response_text
+
+        if not response_cache.enabled:
+            return await _generate(), token_usage
+
+        cache_key = build_cache_key(
+            self.model, TEMPERATURE, user_message, student_context
+        )
+        response_text = await response_cache.get_or_set(cache_key, _generate)
+        return response_text, token_usage
+
+    async def get_angel_responses(
+        self,
+        user_messages: list[str],
+    ) -> tuple[list[str], dict[str, int]]:
+        """
+        Get Angel responses for several messages in a single completion.
+
+        The shared system/few-shot prefix and student context are sent once for
+        the whole batch rather than once per message. Batches larger than fit in
+        the model's output token limit are split into concurrent completions.
+        Batched replies bypass the response and semantic caches.
+
+        Args:
+            user_messages: The users' messages
+
+        Returns:
+            Tuple of (response_texts in input order, token_usage_dict)
+
+        Raises:
+            ValueError: If the model's reply is not a JSON object with a
+                response for every message
+        """
+        if not user_messages:
+            return [], {}
+
+        if len(user_messages) > ANGEL_BATCH_SIZE:
+            results = await asyncio.gather(
+                *[
+                    self.get_angel_responses(user_messages[start : start + ANGEL_BATCH_SIZE])
+                    for start in range(0, len(user_messages), ANGEL_BATCH_SIZE)
+                ]
+            )
+            responses = [response for chunk, _ in results for response in chunk]
+            token_usage = {
+                key: sum(usage.get(key, 0) for _, usage in results)
+                for key in results[0][1]
+            }
+            return responses, token_usage
+
+        student_context = await storage_service.load()
+        messages = _build_angel_messages(
+            _build_angel_batch_prompt(user_messages), student_context
+        )
+
+        self._log.info(
+            "angel_batch_response_started",
+            batch_size=len(user_messages),
+            has_student_context=bool(student_context),
+        )
+
+        response_text, token_usage = await self.chat_completion(
+            messages,
+            max_tokens=min(MAX_TOKENS * len(user_messages), MAX_OUTPUT_TOKENS),
+            response_format={"type": "json_object"},
+        )
+
+        try:
+            replies = orjson.loads(response_text)
+            responses = [str(replies[str(index)]) for index in range(len(user_messages))]
+        except (orjson.JSONDecodeError, TypeError, KeyError) as e:
+            self._log.warning(
+                "angel_batch_response_invalid",
+                error=str(e),
+                batch_size=len(user_messages),
+            )
+            raise ValueError("Batched response is not a JSON object keyed by message index") from e
+
+        return responses, token_usage
+
+    async def _answer_angel_batch(
+        self,
+        user_messages: list[str],
+    ) -> list[tuple[str, dict[str, int]]]:
+        """Answer a micro-batch of Angel messages, sharing one completion where possible.
+
+        Several messages go through get_angel_responses(), so the prompt prefix
+        and student context are sent once and each message is charged an even
+        share of the token usage. A single message, or a batch whose reply is
+        malformed, is answered one completion per message.
+        """
+        if len(user_messages) > 1:
+            try:
+                responses, token_usage = await self.get_angel_responses(user_messages)
+            except ValueError:
+                pass
+            else:
+                return list(zip(responses, _split_token_usage(token_usage, len(responses))))
+
+        student_context = await storage_service.load()
+        return list(
+            await asyncio.gather(
+                *[
+                    self.chat_completion(_build_angel_messages(message, student_context))
+                    for message in user_messages
+                ]
+            )
+        )
+
+    async def stream_angel_response(self, user_message: str) -> AsyncIterator[str]:
+        """
+        Stream a response from the Angel persona.
+
+        Cached responses are yielded as a single chunk. Streamed responses are
+        accumulated so they can populate the caches once the stream completes.
+
+        Args:
+            user_message: The user's message
+
+        Yields:
+            Response text chunks as they are generated
+        """
+        student_context = await storage_service.load()
+        messages = _build_angel_messages(user_message, student_context)
+
+        cache_key = None
+        if response_cache.enabled:
+            cache_key = build_cache_key(
+                self.model, TEMPERATURE, user_message, student_context
+            )
+            cached = await response_cache.get(cache_key)
+            self._log.info("response_cache_lookup", cache_hit=cached is not None)
+            if cached is not None:
+                yield cached
+                return
+
+        namespace = f"{self.model}|{student_context or ''}"
+        cached, vector = await self._semantic_lookup(namespace, user_message)
+        if cached is not None:
+            yield cached
+            return
+
+        parts: list[str] = []
+        # aclosing() closes the inner stream as soon as this generator is closed
+        async with aclosing(self.chat_completion_stream(messages)) as deltas:
+            async for delta in deltas:
+                parts.append(delta)
+                yield delta
+
+        response_text = "".join(parts)
+        if cache_key is not None and response_text:
+            await response_cache.set(cache_key, response_text)
+        if vector is not None:
+            semantic_cache.add(namespace, vector, response_text)
+
+    async def _semantic_lookup(
+        self,
+        namespace: str,
+        user_message: str,
+    ) -> tuple[Optional[str], Optional["np.ndarray"]]:
+        """
+        Look up a semantically similar cached response.
+
+        Args:
+            namespace: Semantic cache partition (model and student context)
+            user_message: The user's message
+
+        Returns:
+            Tuple of (cached_response, embedding). The embedding is returned on a
+            miss so the caller can cache the generated response under it.
+        """
+        if not semantic_cache.enabled:
+            return None, None
+
+        vector = await self.embed(user_message)
+        if vector is None:
+            return None, None
+        return semantic_cache.lookup(namespace, vector), vector
+
+    async def embed(self, text: str) -> Optional["np.ndarray"]:
+        """
+        Embed text for semantic cache lookups.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Normalized embedding vector, or None if the embedding call failed
+        """
+        try:
+            response = await self.client.embeddings.create(
+                model=settings.openai_embedding_model,
+                input=text,
+            )
+        except Exception as e:
+            self._log.warning("embedding_failed", error=str(e), error_type=type(e).__name__)
+            return None
+
+        return normalize_embedding(response.data[0].embedding)
+
+    async def submit_batch(self, requests: list[dict[str, Any]]) -> str:
+        """
+        Submit chat completions to the Batch API for offline processing.
+
+        Batches run within 24 hours at half the per-token price and do not count
+        against the synchronous RPM/TPM limits, so use this for bulk jobs that
+        do not need an immediate answer.
+
+        Args:
+            requests: Chat completion request bodies (model, max_tokens and
+                temperature default to the configured values). Results are
+                keyed by custom_id "request-<index>".
+
+        Returns:
+            ID of the created batch, for poll_batch()
+
+        Raises:
+            APIError: If uploading the input file or creating the batch fails
+        """
+        lines = [
+            orjson.dumps(
+                {
+                    "custom_id": f"request-{index}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "max_tokens": MAX_TOKENS,
+                        "temperature": TEMPERATURE,
+                        **body,
+                    },
+                }
+            )
+            for index, body in enumerate(requests)
         ]
 
-        log = logger.bind(has_student_context=bool(student_context))
-        if student_context:
-            log.info("angel_response_with_student_context")
-        else:
-            log.info("angel_response_without_student_context")
+        input_file = await self.client.files.create(
+            file=("batch_input.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        self._log.info("batch_submitted", batch_id=batch.id, request_count=len(requests))
+        return batch.id
 
-        return await self.chat_completion(messages)
+    async def poll_batch(self, batch_id: str) -> Batch:
+        """
+        Fetch the current state of a submitted batch.
+
+        Args:
+            batch_id: ID returned by submit_batch()
+
+        Returns:
+            The batch; once status is "completed", output_file_id holds the results
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+        self._log.info(
+            "batch_polled",
+            batch_id=batch_id,
+            status=batch.status,
+            request_counts=batch.request_counts.model_dump() if batch.request_counts else None,
+        )
+        return batch
 
 
 # Global service instance
@@ -0,0 +1,141 @@
+"""Micro-batcher that coalesces concurrent requests arriving within a short window."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, Optional, TypeVar
+
+import structlog
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """Collects submitted items into small batches and hands each batch to one call.
+
+    A single worker task drains the queue, closing a batch once it holds
+    max_batch items or max_wait_ms has passed since its first item. The whole
+    batch goes to a single handler call, so work the items share is done once,
+    and every caller's future resolves with its own entry of the result.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[T]], Awaitable[list[R]]],
+        max_batch: int = 16,
+        max_wait_ms: float = 10.0,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            handler: Coroutine function that processes a batch of items and
+                returns one result per item, in order
+            max_batch: Maximum number of items per batch
+            max_wait_ms: Maximum time to wait for a batch to fill, in milliseconds
+        """
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue[tuple[T, asyncio.Future[R]]]] = None
+        self._worker: Optional[asyncio.Task[None]] = None
+        self._inflight: set[asyncio.Task[None]] = set()
+        self._closing = False
+
+    async def submit(self, item: T) -> R:
+        """Queue an item and wait for its result.
+
+        Args:
+            item: Item to pass to the handler
+
+        Returns:
+            The handler's result for this item
+
+        Raises:
+            Exception: Whatever the handler raised for this item's batch
+        """
+        # Started lazily so the worker runs on the serving event loop
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future: asyncio.Future[R] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the worker and wait for dispatched batches to finish.
+
+        Items still queued or in an undispatched batch fail with RuntimeError.
+        """
+        if self._worker is not None:
+            # The flag covers a cancellation swallowed by wait_for (Python < 3.12)
+            # when a queued item arrives at the same moment
+            self._closing = True
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+            self._closing = False
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                self._fail(future)
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def _run(self) -> None:
+        """Collect items into batches until cancelled or closed."""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            try:
+                while len(batch) < self.max_batch and not self._closing:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Closed while collecting: callers of this batch would otherwise hang
+                for _, future in batch:
+                    self._fail(future)
+                raise
+            if self._closing:
+                for _, future in batch:
+                    self._fail(future)
+                return
+
+            logger.debug("micro_batch_dispatched", batch_size=len(batch))
+            # Dispatch without awaiting so the next batch can start filling immediately
+            task = asyncio.create_task(self._resolve(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    @staticmethod
+    def _fail(future: asyncio.Future[R]) -> None:
+        """Fail an undispatched item's future because the batcher was closed."""
+        if not future.done():
+            future.set_exception(RuntimeError("batcher closed"))
+
+    async def _resolve(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        """Run the handler for one batch and hand each caller its outcome."""
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"batch handler returned {len(results)} results for {len(batch)} items"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
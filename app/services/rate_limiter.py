@@ -0,0 +1,75 @@
+"""Token-bucket rate limiter that paces OpenAI requests below the RPM/TPM limits."""
+
+import asyncio
+import time
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class RateLimiter:
+    """Proactive request- and token-per-minute throttle.
+
+    Each budget is a bucket holding up to one minute of capacity that refills
+    continuously. Callers wait until both buckets can cover their request, so
+    bursts are paced below the ceiling instead of bouncing off 429 responses
+    and backing off.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float) -> None:
+        """Initialize the limiter with full buckets.
+
+        Args:
+            requests_per_minute: Maximum requests per minute
+            tokens_per_minute: Maximum (estimated) tokens per minute
+        """
+        self.max_requests = requests_per_minute
+        self.max_tokens = tokens_per_minute
+        self._available_requests = requests_per_minute
+        self._available_tokens = tokens_per_minute
+        self._last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        """Top up both buckets for the time elapsed since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._available_requests = min(
+            self.max_requests,
+            self._available_requests + elapsed * self.max_requests / 60,
+        )
+        self._available_tokens = min(
+            self.max_tokens,
+            self._available_tokens + elapsed * self.max_tokens / 60,
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request and the given number of tokens are available.
+
+        Args:
+            tokens: Estimated tokens the request will consume (prompt + completion)
+        """
+        # A request larger than the whole bucket would otherwise wait forever
+        tokens = min(tokens, self.max_tokens)
+        throttled = False
+
+        while True:
+            self._refill()
+            # No await between the check and the deduction, so no lock is needed
+            if self._available_requests >= 1 and self._available_tokens >= tokens:
+                self._available_requests -= 1
+                self._available_tokens -= tokens
+                if throttled:
+                    logger.debug("rate_limiter_released", estimated_tokens=tokens)
+                return
+
+            if not throttled:
+                throttled = True
+                logger.info("rate_limiter_throttled", estimated_tokens=tokens)
+
+            wait = max(
+                (1 - self._available_requests) * 60 / self.max_requests,
+                (tokens - self._available_tokens) * 60 / self.max_tokens,
+            )
+            await asyncio.sleep(wait)
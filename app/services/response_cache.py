@@ -0,0 +1,132 @@
+"""Response cache for Angel replies with in-process (local) and Redis (Vercel) tiers."""
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+import structlog
+from cachetools import TTLCache
+
+from app.config import get_settings
+from app.services.storage_service import storage_service
+
+settings = get_settings()
+logger = structlog.get_logger()
+
+# Key prefix for cached responses in Redis
+RESPONSE_CACHE_KEY_PREFIX = "angel_response:"
+
+
+def build_cache_key(
+    model: str,
+    temperature: float,
+    message: str,
+    student_context: Optional[str] = None,
+) -> str:
+    """Build a content-hash cache key for a chat request.
+
+    Args:
+        model: Model used to generate the response
+        temperature: Sampling temperature (bucketed to one decimal place)
+        message: The user's message (whitespace- and case-normalized)
+        student_context: Optional student context included in the system prompt
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = f"{model}|{round(temperature, 1)}|{student_context or ''}|{message.strip().casefold()}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """Cache for generated responses keyed on request content.
+
+    Responses are kept in an in-process TTL cache and, when Redis is configured,
+    mirrored to Redis so they are shared across serverless instances.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the response cache."""
+        self.ttl = settings.response_cache_ttl_seconds
+        # Only touched from the event loop thread, so no lock is needed
+        self._local: TTLCache[str, str] = TTLCache(
+            maxsize=settings.response_cache_max_size,
+            ttl=self.ttl,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are deterministic enough to be worth caching."""
+        return settings.openai_temperature <= settings.response_cache_max_temperature
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a cached response.
+
+        Args:
+            key: Cache key from build_cache_key()
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        value = self._local.get(key)
+        if value is not None:
+            return value
+
+        redis_client = storage_service.redis_client
+        if not (storage_service.use_redis and redis_client):
+            return None
+
+        try:
+            value = await asyncio.to_thread(redis_client.get, RESPONSE_CACHE_KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning("response_cache_redis_get_failed", error=str(e))
+            return None
+
+        if value is not None:
+            self._local[key] = value
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response in the cache.
+
+        Args:
+            key: Cache key from build_cache_key()
+            value: Response text to cache
+        """
+        self._local[key] = value
+
+        redis_client = storage_service.redis_client
+        if not (storage_service.use_redis and redis_client):
+            return
+
+        try:
+            await asyncio.to_thread(
+                redis_client.setex, RESPONSE_CACHE_KEY_PREFIX + key, self.ttl, value
+            )
+        except Exception as e:
+            logger.warning("response_cache_redis_set_failed", error=str(e))
+
+    async def get_or_set(self, key: str, factory: Callable[[], Awaitable[str]]) -> str:
+        """Return the cached response for key, generating and caching it on a miss.
+
+        Args:
+            key: Cache key from build_cache_key()
+            factory: Coroutine function producing the response on a miss
+
+        Returns:
+            Response text
+        """
+        cached = await self.get(key)
+        logger.info("response_cache_lookup", cache_hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        value = await factory()
+        if value:
+            await self.set(key, value)
+        return value
+
+
+# Global cache instance
+response_cache = ResponseCache()
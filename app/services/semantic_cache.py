@@ -0,0 +1,140 @@
+"""Semantic cache that reuses responses for near-duplicate messages via embedding similarity."""
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Optional
+
+import structlog
+from cachetools import LRUCache
+
+from app.config import get_settings
+
+# numpy is imported on first use so cold starts skip it while the cache is disabled
+if TYPE_CHECKING:
+    import numpy as np
+
+settings = get_settings()
+logger = structlog.get_logger()
+
+# Initial number of rows allocated per partition (grows by doubling)
+_INITIAL_CAPACITY = 64
+
+
+def normalize_embedding(embedding: Sequence[float]) -> Optional["np.ndarray"]:
+    """L2-normalize an embedding so that dot products are cosine similarities.
+
+    Args:
+        embedding: Raw embedding vector
+
+    Returns:
+        Normalized float32 vector, or None for a zero vector
+    """
+    import numpy as np
+
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return None
+    return vector / norm
+
+
+class _Partition:
+    """Embedding matrix and parallel response list for one namespace."""
+
+    __slots__ = ("vectors", "responses", "next_evict")
+
+    def __init__(self, dim: int) -> None:
+        import numpy as np
+
+        self.vectors = np.empty((_INITIAL_CAPACITY, dim), dtype=np.float32)
+        self.responses: list[str] = []
+        self.next_evict = 0
+
+    def search(self, vector: "np.ndarray") -> tuple[float, int]:
+        """Return (similarity, index) of the closest cached entry."""
+        import numpy as np
+
+        similarities = self.vectors[: len(self.responses)] @ vector
+        index = int(np.argmax(similarities))
+        return float(similarities[index]), index
+
+    def add(self, vector: "np.ndarray", response: str, max_entries: int) -> None:
+        """Append an entry, overwriting the oldest one once max_entries is reached."""
+        import numpy as np
+
+        size = len(self.responses)
+        if size >= max_entries:
+            slot = self.next_evict
+            self.vectors[slot] = vector
+            self.responses[slot] = response
+            self.next_evict = (slot + 1) % max_entries
+            return
+
+        if size == len(self.vectors):
+            grown = np.empty((min(size * 2, max_entries), self.vectors.shape[1]), dtype=np.float32)
+            grown[:size] = self.vectors
+            self.vectors = grown
+        self.vectors[size] = vector
+        self.responses.append(response)
+
+
+class SemanticCache:
+    """In-process cache of (embedding, response) pairs matched by cosine similarity.
+
+    Entries are partitioned by namespace (model and student context) so that a
+    response is only reused for prompts that share the same system prompt. Only
+    the most recently used partitions are kept, so partitions left behind by a
+    changed student context are evicted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the semantic cache."""
+        self.threshold = settings.semantic_cache_threshold
+        self.max_entries = settings.semantic_cache_max_entries
+        self._partitions: LRUCache[str, _Partition] = LRUCache(
+            maxsize=settings.semantic_cache_max_partitions
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether semantic caching is turned on."""
+        return settings.semantic_cache_enabled
+
+    def lookup(self, namespace: str, vector: "np.ndarray") -> Optional[str]:
+        """Find a cached response for a semantically similar message.
+
+        Args:
+            namespace: Partition key for the prompt (model and context)
+            vector: Normalized embedding of the user's message
+
+        Returns:
+            Cached response text if the best match meets the similarity threshold
+        """
+        partition = self._partitions.get(namespace)
+        if partition is None or not partition.responses:
+            logger.info("semantic_cache_lookup", cache_hit=False)
+            return None
+
+        similarity, index = partition.search(vector)
+        cache_hit = similarity >= self.threshold
+        logger.info("semantic_cache_lookup", cache_hit=cache_hit, similarity=round(similarity, 4))
+        return partition.responses[index] if cache_hit else None
+
+    def add(self, namespace: str, vector: "np.ndarray", response: str) -> None:
+        """Cache a response under the embedding of the message that produced it.
+
+        Args:
+            namespace: Partition key for the prompt (model and context)
+            vector: Normalized embedding of the user's message
+            response: Response text to cache
+        """
+        if not response:
+            return
+
+        partition = self._partitions.get(namespace)
+        if partition is None:
+            partition = self._partitions[namespace] = _Partition(vector.shape[0])
+        partition.add(vector, response, self.max_entries)
+
+
+# Global cache instance
+semantic_cache = SemanticCache()
@@ -1,20 +1,40 @@
 """Storage service for student responses with support for file-based (local) and Redis (Vercel) storage."""
 
-import json
+import asyncio
 import os
+import time
+import uuid
+from collections import defaultdict
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+import aiofiles
+import aiofiles.os
+import orjson
 import structlog
-from upstash_redis import Redis
 
-from app.config import settings
+from app.config import get_settings
 from app.models.questions import QuestionsRequest
 
+if TYPE_CHECKING:
+    from upstash_redis import Redis
+
+settings = get_settings()
 logger = structlog.get_logger()
 
 # Storage key for Redis
 STUDENT_RESPONSES_KEY = "student_responses"
+# Pre-rendered context string stored alongside the raw responses
+STUDENT_CONTEXT_KEY = "student_responses:ctx"
+
+# Context template appended to the system prompt (missing answers read "Not provided")
+_CTX_TMPL = """The student has shared the following information:
+Q1: {q1}
+Q2: {q2}
+Q3: {q3}
+Q4: {q4}
+
+Use this information to personalize your responses and reference their behavior when appropriate."""
 
 # Local file path
 LOCAL_STORAGE_PATH = Path(__file__).parent.parent / "data" / "student_responses.txt"
@@ -28,20 +48,51 @@ class StorageService:
     """
 
     def __init__(self) -> None:
-        """Initialize the storage service."""
+        """Initialize the storage service.
+
+        The Redis client (and the upstash_redis import) is created on first use
+        rather than at import, to keep serverless cold starts fast.
+        """
         # Use the properties that handle both naming conventions
-        redis_url = settings.redis_url
-        redis_token = settings.redis_token
-        self.use_redis = bool(redis_url and redis_token)
-        self.redis_client: Redis | None = None
+        self.use_redis = bool(settings.redis_url and settings.redis_token)
+        self._redis_client: Optional["Redis"] = None
+
+        # Short-lived cache of the formatted context (None is a valid cached value)
+        self._context_ttl = settings.student_context_cache_ttl_seconds
+        self._cached_context: Optional[str] = None
+        self._cached_at: Optional[float] = None
+        # Bumped on every save so a load that raced with a save is not cached
+        self._version = 0
+        # Load shared by concurrent callers while the cache is stale
+        self._inflight: Optional[asyncio.Task[Optional[str]]] = None
+
+        logger.info("storage_service_initialized", method="redis" if self.use_redis else "file")
+
+    @property
+    def redis_client(self) -> Optional["Redis"]:
+        """Redis client, created on first access (None when using file storage)."""
+        if not self.use_redis:
+            return None
+        return self._get_client()
+
+    def _get_client(self) -> Optional["Redis"]:
+        """Create the Redis client on first call and reuse it afterwards.
+
+        Falls back to file storage if the client cannot be created.
 
-        if self.use_redis:
+        Returns:
+            The Redis client, or None if initialization failed
+        """
+        if self._redis_client is None:
+            redis_url = settings.redis_url
             try:
-                self.redis_client = Redis(
+                from upstash_redis import Redis
+
+                self._redis_client = Redis(
                     url=redis_url,
-                    token=redis_token,
+                    token=settings.redis_token,
                 )
-                logger.info("storage_service_initialized", method="redis", url=redis_url[:30] + "...")
+                logger.info("redis_client_initialized", url=redis_url[:30] + "...")
             except Exception as e:
                 logger.warning(
                     "redis_initialization_failed",
@@ -49,8 +100,7 @@ class StorageService:
                     falling_back_to_file=True,
                 )
                 self.use_redis = False
-        else:
-            logger.info("storage_service_initialized", method="file")
+        return self._redis_client
 
     async def save(self, questions: QuestionsRequest) -> None:
         """Save student responses to storage.
@@ -61,25 +111,71 @@ class StorageService:
         Raises:
             Exception: If storage operation fails
         """
-        data = {
-            "q1": questions.q1,
-            "q2": questions.q2,
-            "q3": questions.q3,
-            "q4": questions.q4,
-        }
+        # Already validated at the API boundary, so dump without re-validating
+        data = questions.model_dump()
+        # Rendered once here rather than on every load()
+        context = self._format_context(data)
 
         if self.use_redis and self.redis_client:
-            await self._save_to_redis(data)
+            await self._save_to_redis(data, context)
         else:
             await self._save_to_file(data)
 
+        self._version += 1
+        # Later callers must not join a load that started before this save
+        self._inflight = None
+        self._cached_context = context
+        self._cached_at = time.monotonic()
+
     async def load(self) -> Optional[str]:
         """Load student responses from storage.
 
+        The formatted context is cached in-process for a few seconds, and
+        concurrent loads of a stale cache share a single read, so bursts of chat
+        requests make at most one Redis round-trip or file read.
+
+        Returns:
+            Formatted string with student context, or None if no responses exist
+        """
+        if self._cached_at is not None and time.monotonic() - self._cached_at < self._context_ttl:
+            return self._cached_context
+
+        # Concurrent callers share one in-flight load instead of each hitting storage.
+        # There is no await between the check and the assignment, so no lock is needed.
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._load_and_cache())
+        # Shielded so a cancelled caller does not cancel the load for everyone else
+        return await asyncio.shield(self._inflight)
+
+    async def _load_and_cache(self) -> Optional[str]:
+        """Load the context once and cache it unless a save happened meanwhile.
+
+        Returns:
+            Formatted string with student context, or None if no responses exist
+        """
+        version = self._version
+        try:
+            context = await self._load_context()
+        finally:
+            if self._inflight is asyncio.current_task():
+                self._inflight = None
+
+        if version == self._version:
+            self._cached_context = context
+            self._cached_at = time.monotonic()
+        return context
+
+    async def _load_context(self) -> Optional[str]:
+        """Load student responses from the storage backend and format them.
+
         Returns:
             Formatted string with student context, or None if no responses exist
         """
         if self.use_redis and self.redis_client:
+            context = await self._load_context_from_redis()
+            if context is not None:
+                return context
+            # Saved before the rendered context was stored alongside the data
             data = await self._load_from_redis()
         else:
             data = await self._load_from_file()
@@ -89,24 +185,46 @@ class StorageService:
 
         return self._format_context(data)
 
-    async def _save_to_redis(self, data: dict[str, str]) -> None:
-        """Save data to Redis.
+    async def _save_to_redis(self, data: dict[str, str], context: str) -> None:
+        """Save data and its formatted context to Redis.
 
         Args:
             data: Dictionary with question responses
+            context: Formatted context string from _format_context()
         """
         if not self.redis_client:
             raise ValueError("Redis client not initialized")
 
         try:
-            json_data = json.dumps(data)
-            # upstash_redis.Redis is synchronous (no await needed)
-            self.redis_client.set(STUDENT_RESPONSES_KEY, json_data)
+            json_data = orjson.dumps(data).decode("utf-8")
+            # upstash_redis.Redis is synchronous, so run the HTTP call off the event loop
+            await asyncio.to_thread(
+                self.redis_client.mset,
+                {STUDENT_RESPONSES_KEY: json_data, STUDENT_CONTEXT_KEY: context},
+            )
             logger.info("student_responses_saved", method="redis", key=STUDENT_RESPONSES_KEY)
         except Exception as e:
             logger.exception("redis_save_failed", error=str(e))
             raise
 
+    async def _load_context_from_redis(self) -> Optional[str]:
+        """Load the pre-rendered context string from Redis.
+
+        Returns:
+            Formatted context string, or None if not found
+        """
+        if not self.redis_client:
+            return None
+
+        try:
+            context = await asyncio.to_thread(self.redis_client.get, STUDENT_CONTEXT_KEY)
+            if context is not None:
+                logger.info("student_responses_loaded", method="redis", key=STUDENT_CONTEXT_KEY)
+            return context
+        except Exception as e:
+            logger.warning("redis_load_failed", error=str(e))
+            return None
+
     async def _load_from_redis(self) -> Optional[dict[str, str]]:
         """Load data from Redis.
 
@@ -117,11 +235,11 @@ class StorageService:
             return None
 
         try:
-            # upstash_redis.Redis is synchronous (no await needed)
-            json_data = self.redis_client.get(STUDENT_RESPONSES_KEY)
+            # upstash_redis.Redis is synchronous, so run the HTTP call off the event loop
+            json_data = await asyncio.to_thread(self.redis_client.get, STUDENT_RESPONSES_KEY)
             if json_data is None:
                 return None
-            data = json.loads(json_data)
+            data = orjson.loads(json_data)
             logger.info("student_responses_loaded", method="redis", key=STUDENT_RESPONSES_KEY)
             return data
         except Exception as e:
@@ -134,17 +252,28 @@ class StorageService:
         Args:
             data: Dictionary with question responses
         """
+        # Unique per save so overlapping saves never share (and truncate) a temp file
+        tmp_path = LOCAL_STORAGE_PATH.with_name(
+            f"{LOCAL_STORAGE_PATH.name}.{uuid.uuid4().hex}.tmp"
+        )
         try:
             # Ensure data directory exists
-            LOCAL_STORAGE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            await aiofiles.os.makedirs(LOCAL_STORAGE_PATH.parent, exist_ok=True)
 
-            # Write JSON to file
-            with open(LOCAL_STORAGE_PATH, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            # Write compact JSON to a temp file, then atomically swap it in so a
+            # crash mid-write never leaves a truncated file (aiofiles runs the
+            # blocking I/O in a thread)
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(orjson.dumps(data))
+            await aiofiles.os.replace(tmp_path, LOCAL_STORAGE_PATH)
 
             logger.info("student_responses_saved", method="file", path=str(LOCAL_STORAGE_PATH))
         except Exception as e:
             logger.exception("file_save_failed", error=str(e), path=str(LOCAL_STORAGE_PATH))
+            try:
+                await aiofiles.os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
             raise
 
     async def _load_from_file(self) -> Optional[dict[str, str]]:
@@ -154,14 +283,13 @@ class StorageService:
             Dictionary with question responses, or None if file doesn't exist
         """
         try:
-            if not LOCAL_STORAGE_PATH.exists():
-                return None
-
-            with open(LOCAL_STORAGE_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            async with aiofiles.open(LOCAL_STORAGE_PATH, "rb") as f:
+                data = orjson.loads(await f.read())
 
             logger.info("student_responses_loaded", method="file", path=str(LOCAL_STORAGE_PATH))
             return data
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.warning("file_load_failed", error=str(e), path=str(LOCAL_STORAGE_PATH))
             return None
@@ -175,13 +303,7 @@ class StorageService:
         Returns:
             Formatted string with student context
         """
-        return f"""The student has shared the following information:
-Q1: {data.get('q1', 'Not provided')}
-Q2: {data.get('q2', 'Not provided')}
-Q3: {data.get('q3', 'Not provided')}
-Q4: {data.get('q4', 'Not provided')}
-
-Use this information to personalize your responses and reference their behavior when appropriate."""
+        return _CTX_TMPL.format_map(defaultdict(lambda: "Not provided", data))
 
 
 # Global service instance
@@ -19,16 +19,16 @@ def main() -> None:
     try:
         redis = Redis.from_env()
 
-        # Test write (synchronous - no await needed)
-        redis.set("test_key", "test_value")
-        print("✓ Successfully wrote to Redis")
-
-        # Test read
-        value = redis.get("test_key")
-        print(f"✓ Successfully read from Redis: {value}")
+        # Test write, read and clean up in one pipelined request
+        # (synchronous - no await needed)
+        pipe = redis.pipeline()
+        pipe.set("test_key", "test_value")
+        pipe.get("test_key")
+        pipe.delete("test_key")
+        results = pipe.exec()
 
-        # Clean up
-        redis.delete("test_key")
+        print("✓ Successfully wrote to Redis")
+        print(f"✓ Successfully read from Redis: {results[1]}")
         print("✓ Successfully deleted test key")
 
         print("\n✅ Upstash Redis connection validated successfully!")
@@ -0,0 +1,73 @@
+"""Shared pytest fixtures."""
+
+import os
+
+import httpx
+import pytest
+from openai.types.chat import ChatCompletion
+
+# Settings require an API key at import; tests never call the real API
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from app.main import app
+from app.services import storage_service as storage_module
+from app.services.ai_service import ai_service
+from app.services.storage_service import storage_service
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio (the code under test uses asyncio primitives)."""
+    return "asyncio"
+
+
+def make_completion(content: str = "✨ You are wonderful! ✨") -> ChatCompletion:
+    """Build a chat completion as the OpenAI API would return it."""
+    return ChatCompletion.model_validate(
+        {
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }
+            ],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        }
+    )
+
+
+@pytest.fixture
+def storage_path(tmp_path, monkeypatch):
+    """Point the global storage service at a temporary file (never Redis)."""
+    path = tmp_path / "student_responses.txt"
+    monkeypatch.setattr(storage_module, "LOCAL_STORAGE_PATH", path)
+    monkeypatch.setattr(storage_service, "use_redis", False)
+    monkeypatch.setattr(storage_service, "_cached_at", None)
+    monkeypatch.setattr(storage_service, "_inflight", None)
+    return path
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    """Answer chat completions locally; returns the list of requests sent."""
+    requests: list[dict] = []
+
+    async def create_completion(request: dict) -> ChatCompletion:
+        requests.append(request)
+        return make_completion()
+
+    monkeypatch.setattr(ai_service, "_create_completion", create_completion)
+    return requests
+
+
+@pytest.fixture
+async def client(storage_path, fake_openai):
+    """Async client driving the app in-process with a faked OpenAI API."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
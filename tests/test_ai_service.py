@@ -0,0 +1,63 @@
+"""Tests for AIService streaming."""
+
+import pytest
+from openai.types.chat import ChatCompletionChunk
+
+from app.services.ai_service import ai_service
+
+
+class FakeStream:
+    """Minimal AsyncStream stand-in that records whether it was closed."""
+
+    def __init__(self, deltas: list[str]) -> None:
+        self.deltas = deltas
+        self.closed = False
+
+    async def __aenter__(self) -> "FakeStream":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.closed = True
+
+    async def __aiter__(self):
+        for delta in self.deltas:
+            yield ChatCompletionChunk.model_validate(
+                {
+                    "id": "chatcmpl-test",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": "gpt-4o-mini",
+                    "choices": [{"index": 0, "delta": {"content": delta}}],
+                }
+            )
+
+
+@pytest.fixture
+def fake_stream(monkeypatch):
+    stream = FakeStream(["✨ You ", "are ", "wonderful! ✨"])
+
+    async def create_stream(messages, model_name):
+        return stream
+
+    monkeypatch.setattr(ai_service, "_create_stream", create_stream)
+    return stream
+
+
+@pytest.mark.anyio
+async def test_stream_is_closed_after_full_read(storage_path, fake_stream):
+    """Reading the stream to the end closes it."""
+    deltas = [delta async for delta in ai_service.stream_angel_response("stream full read")]
+
+    assert "".join(deltas) == "✨ You are wonderful! ✨"
+    assert fake_stream.closed
+
+
+@pytest.mark.anyio
+async def test_stream_is_closed_when_consumer_stops_early(storage_path, fake_stream):
+    """Closing the outer generator mid-stream releases the upstream stream."""
+    deltas = ai_service.stream_angel_response("stream early stop")
+
+    assert await anext(deltas) == "✨ You "
+    await deltas.aclose()
+
+    assert fake_stream.closed
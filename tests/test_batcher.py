@@ -0,0 +1,169 @@
+"""Tests for the MicroBatcher."""
+
+import asyncio
+
+import orjson
+import pytest
+
+from app.services.ai_service import ai_service
+from app.services.batcher import MicroBatcher
+from tests.conftest import make_completion
+
+
+async def _echo(items: list[int]) -> list[int]:
+    await asyncio.sleep(0.01)
+    return items
+
+
+def _recording_echo(calls: list[list[int]]):
+    """Echo handler that records the batch it was called with."""
+
+    async def handler(items: list[int]) -> list[int]:
+        calls.append(items)
+        return items
+
+    return handler
+
+
+@pytest.mark.anyio
+async def test_full_batches_go_to_one_handler_call_each():
+    """Concurrent items are grouped into max_batch-sized calls, results in order."""
+    calls: list[list[int]] = []
+    batcher = MicroBatcher(_recording_echo(calls), max_batch=3, max_wait_ms=1000)
+
+    results = await asyncio.wait_for(asyncio.gather(*[batcher.submit(i) for i in range(6)]), 1)
+    await batcher.close()
+
+    assert results == list(range(6))
+    assert calls == [[0, 1, 2], [3, 4, 5]]
+
+
+@pytest.mark.anyio
+async def test_partial_batch_dispatches_after_max_wait():
+    """A batch that never fills is dispatched once max_wait_ms has passed."""
+    calls: list[list[int]] = []
+    batcher = MicroBatcher(_recording_echo(calls), max_batch=10, max_wait_ms=5)
+
+    results = await asyncio.wait_for(asyncio.gather(*[batcher.submit(i) for i in range(2)]), 1)
+    await batcher.close()
+
+    assert results == [0, 1]
+    assert calls == [[0, 1]]
+
+
+@pytest.mark.anyio
+async def test_handler_error_fails_every_item_in_the_batch():
+    """An exception from the handler is raised to every caller in its batch."""
+
+    async def broken(items: list[int]) -> list[int]:
+        raise ValueError("boom")
+
+    batcher = MicroBatcher(broken, max_batch=2, max_wait_ms=1000)
+    results = await asyncio.wait_for(
+        asyncio.gather(*[batcher.submit(i) for i in range(2)], return_exceptions=True), 1
+    )
+    await batcher.close()
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.anyio
+async def test_result_count_mismatch_fails_the_batch():
+    """A handler returning the wrong number of results fails instead of misrouting."""
+
+    async def short(items: list[int]) -> list[int]:
+        return items[:1]
+
+    batcher = MicroBatcher(short, max_batch=2, max_wait_ms=1000)
+    results = await asyncio.wait_for(
+        asyncio.gather(*[batcher.submit(i) for i in range(2)], return_exceptions=True), 1
+    )
+    await batcher.close()
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.anyio
+async def test_angel_messages_share_one_completion(storage_path, monkeypatch):
+    """With micro-batching on, concurrent Angel messages cost one OpenAI request."""
+    requests: list[dict] = []
+
+    async def create_completion(request: dict):
+        requests.append(request)
+        return make_completion(orjson.dumps({str(i): f"reply {i}" for i in range(3)}).decode())
+
+    monkeypatch.setattr(ai_service, "_create_completion", create_completion)
+    batcher = MicroBatcher(ai_service._answer_angel_batch, max_batch=3, max_wait_ms=1000)
+    monkeypatch.setattr(ai_service, "batcher", batcher)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*[ai_service.get_angel_response(f"shared batch {i}") for i in range(3)]),
+        1,
+    )
+    await batcher.close()
+
+    assert len(requests) == 1
+    assert requests[0]["response_format"] == {"type": "json_object"}
+    assert [text for text, _ in results] == ["reply 0", "reply 1", "reply 2"]
+    assert sum(usage["total_tokens"] for _, usage in results) == 15
+
+
+@pytest.mark.anyio
+async def test_close_fails_undispatched_items():
+    """Items still waiting for their batch to fill fail instead of hanging."""
+    batcher = MicroBatcher(_echo, max_batch=100, max_wait_ms=1000)
+    pending = [asyncio.create_task(batcher.submit(i)) for i in range(3)]
+    await asyncio.sleep(0.01)
+
+    await batcher.close()
+    results = await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), 1)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.anyio
+async def test_close_lets_dispatched_items_finish():
+    """Dispatched items complete; only the queued remainder fails."""
+    batcher = MicroBatcher(_echo, max_batch=2, max_wait_ms=1000)
+    pending = [asyncio.create_task(batcher.submit(i)) for i in range(5)]
+    # Long enough for both full batches to dispatch, shorter than the handler
+    await asyncio.sleep(0.005)
+
+    await batcher.close()
+    results = await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), 1)
+
+    assert results[:4] == [0, 1, 2, 3]
+    assert isinstance(results[4], RuntimeError)
+
+
+@pytest.mark.anyio
+async def test_close_right_after_submit_does_not_hang():
+    """Closing while items are still arriving resolves every caller."""
+    batcher = MicroBatcher(_echo, max_batch=2, max_wait_ms=1000)
+    pending = [asyncio.create_task(batcher.submit(i)) for i in range(5)]
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(batcher.close(), 1)
+    results = await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), 1)
+
+    assert all(r == i or isinstance(r, RuntimeError) for i, r in enumerate(results))
+
+
+@pytest.mark.anyio
+async def test_malformed_batched_reply_falls_back_to_single_completions(
+    storage_path, fake_openai, monkeypatch
+):
+    """If the shared reply is not valid JSON, each message gets its own completion."""
+    batcher = MicroBatcher(ai_service._answer_angel_batch, max_batch=2, max_wait_ms=1000)
+    monkeypatch.setattr(ai_service, "batcher", batcher)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*[ai_service.get_angel_response(f"fallback batch {i}") for i in range(2)]),
+        1,
+    )
+    await batcher.close()
+
+    # One failed batched request, then one per message
+    assert len(fake_openai) == 3
+    assert all(text == make_completion().choices[0].message.content for text, _ in results)
@@ -0,0 +1,72 @@
+"""Tests for the questions router: content negotiation and form submission."""
+
+import orjson
+import pytest
+
+from app.api.v1.questions import _etag_matches, _preferred_encoding
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, "identity"),
+        ("", "identity"),
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("deflate", "identity"),
+        ("*", "br"),
+        ("br;q=0, *", "gzip"),
+        ("br;q=0, gzip;q=0, *", "identity"),
+        ("gzip;q=1.0, br;q=0.1", "gzip"),
+        ("gzip;q=0.5, br;q=0.5", "br"),
+        ("br;q=0.2, *;q=0.8", "gzip"),
+        ("identity;q=1, gzip;q=0.5", "identity"),
+        ("GZIP; q=0.9", "gzip"),
+        ("br;q=bogus, gzip", "gzip"),
+    ],
+)
+def test_preferred_encoding(header, expected):
+    """The highest-q accepted coding wins, and q=0 refuses it even with *."""
+    assert _preferred_encoding(header) == expected
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ("", False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ('"xyz"', False),
+        ("*", True),
+    ],
+)
+def test_etag_matches(header, expected):
+    """If-None-Match uses weak comparison and accepts the * wildcard."""
+    assert _etag_matches(header, '"abc"') is expected
+
+
+ANSWERS = {"q1": "On time", "q2": "Asked a friend", "q3": "I ask questions", "q4": "3"}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("answers", [{"q1": "a", "q3": "c", "q4": "d"}, {**ANSWERS, "q2": ""}])
+async def test_submit_missing_or_empty_answer_is_422(client, storage_path, answers):
+    """A missing or empty answer fails validation with a body-located error."""
+    response = await client.post("/questions/submit", data=answers)
+
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [["body", "q2"]]
+    assert not storage_path.exists()
+
+
+@pytest.mark.anyio
+async def test_submit_saves_answers(client, storage_path):
+    """A complete url-encoded submission is saved and answered with the success page."""
+    response = await client.post("/questions/submit", data=ANSWERS)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    saved = orjson.loads(storage_path.read_bytes())
+    assert {key: saved[key] for key in ANSWERS} == ANSWERS
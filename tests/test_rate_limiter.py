@@ -0,0 +1,107 @@
+"""Tests for the token-bucket RateLimiter, driven by a fake clock."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import rate_limiter as rate_limiter_module
+from app.services.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Stands in for time.monotonic; asyncio.sleep advances it instead of waiting."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Patch the module's references only, so the event loop keeps the real clock
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(rate_limiter_module, "asyncio", SimpleNamespace(sleep=clock.sleep))
+    return clock
+
+
+@pytest.mark.anyio
+async def test_full_bucket_allows_a_burst(clock):
+    """A fresh limiter admits a minute's worth of requests without waiting."""
+    limiter = RateLimiter(requests_per_minute=5, tokens_per_minute=1000)
+
+    for _ in range(5):
+        await limiter.acquire(100)
+
+    assert clock.sleeps == []
+
+
+@pytest.mark.anyio
+async def test_waits_for_request_refill(clock):
+    """Once the request bucket is empty, the next caller waits for one refill."""
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=1_000_000)
+    for _ in range(60):
+        await limiter.acquire(1)
+
+    await limiter.acquire(1)
+
+    # 60 RPM refills one request per second
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+@pytest.mark.anyio
+async def test_refill_over_elapsed_time_avoids_waiting(clock):
+    """Time passing between calls tops the buckets up, capped at their size."""
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600)
+    await limiter.acquire(600)
+
+    clock.now += 30
+    await limiter.acquire(300)
+    assert clock.sleeps == []
+
+    # A long idle period refills no more than one minute's capacity
+    clock.now += 3600
+    limiter._refill()
+    assert limiter._available_requests == 60
+    assert limiter._available_tokens == 600
+
+
+@pytest.mark.anyio
+async def test_request_larger_than_bucket_is_clamped(clock):
+    """An estimate above tokens_per_minute waits for a full bucket, not forever."""
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600)
+
+    await limiter.acquire(10_000)
+    assert clock.sleeps == []
+    assert limiter._available_tokens == 0
+
+    await limiter.acquire(10_000)
+    # The whole 600-token bucket takes a minute to refill
+    assert clock.sleeps == [pytest.approx(60.0)]
+
+
+@pytest.mark.anyio
+async def test_wait_covers_the_slower_bucket(clock):
+    """The wait is the longer of the request and token refill times."""
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600)
+    limiter._available_requests = 0.5
+    limiter._available_tokens = 500
+
+    # Requests need 0.5s (0.5 req at 1 req/s); tokens need 0s
+    await limiter.acquire(100)
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+    clock.sleeps.clear()
+    limiter._available_requests = 0.5
+    limiter._available_tokens = 0
+
+    # Tokens need 30s (300 tokens at 10 tokens/s), longer than the 0.5s for requests
+    await limiter.acquire(300)
+    assert clock.sleeps == [pytest.approx(30.0)]
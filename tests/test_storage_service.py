@@ -0,0 +1,37 @@
+"""Tests for the file-based StorageService backend."""
+
+import asyncio
+
+import orjson
+import pytest
+
+from app.models.questions import QuestionsRequest
+from app.services import storage_service as storage_module
+from app.services.storage_service import StorageService
+
+
+@pytest.fixture
+def file_storage(tmp_path, monkeypatch):
+    """A StorageService writing to a temporary directory."""
+    monkeypatch.setattr(storage_module, "LOCAL_STORAGE_PATH", tmp_path / "student_responses.txt")
+    service = StorageService()
+    service.use_redis = False
+    return service
+
+
+@pytest.mark.anyio
+async def test_concurrent_saves_all_succeed(file_storage, tmp_path):
+    """Overlapping saves each complete and leave one whole file behind."""
+    submissions = [
+        QuestionsRequest(q1=f"answer {i}", q2="b", q3="c", q4="d") for i in range(20)
+    ]
+
+    results = await asyncio.gather(
+        *[file_storage.save(questions) for questions in submissions],
+        return_exceptions=True,
+    )
+
+    assert [r for r in results if isinstance(r, Exception)] == []
+    saved = orjson.loads((tmp_path / "student_responses.txt").read_bytes())
+    assert saved in [questions.model_dump() for questions in submissions]
+    assert [p.name for p in tmp_path.iterdir()] == ["student_responses.txt"]